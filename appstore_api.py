@@ -5,32 +5,105 @@ This module provides functions to interact with the App Store Connect
 Analytics API for downloading app analytics reports.
 
 Usage:
-    from appstore_api import AppStoreClient
+    from appstore_api import get_client
 
-    client = AppStoreClient()
+    client = get_client()
     reports = client.list_report_requests()
 """
 
 from __future__ import annotations
 
-import csv
-import gzip
+import functools
+import io
+import mmap
 import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from auth import generate_token
 
+# ISA-L decompresses gzip several times faster than zlib; optional.
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+# orjson parses API responses several times faster than json; optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 # API Configuration
 API_BASE = "https://api.appstoreconnect.apple.com/v1"
 DEFAULT_TIMEOUT = 30
+CACHE_TTL = 60
 DOWNLOAD_TIMEOUT = 120
+COPY_CHUNK_SIZE = 1024 * 1024
+UTF8_BOM = b"\xef\xbb\xbf"
+SEGMENT_WORKERS = 4
+
+# Large gzip segments are decompressed by pigz in a separate process
+PIGZ_PATH = shutil.which("pigz")
+PIGZ_MIN_SIZE = 64 * 1024 * 1024
+
+# Connection pool settings
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+# Each concurrent instance download may fetch SEGMENT_WORKERS segments at once
+DOWNLOAD_POOL_MAXSIZE = POOL_MAXSIZE * SEGMENT_WORKERS
+# Parallel report downloads (kept within the client's connection pool size)
+DOWNLOAD_WORKERS = min(8, POOL_MAXSIZE)
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5
+RETRY_JITTER = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a session with connection pooling and retries.
+
+    Transient failures (429/5xx, connection errors) on idempotent methods
+    are retried with jittered exponential backoff, honouring Retry-After.
+    POST is left out so a report request is never created twice.
+    """
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        backoff_jitter=RETRY_JITTER,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def _decode_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class AppStoreClient:
@@ -48,36 +121,64 @@ class AppStoreClient:
         if not self.app_id:
             raise SystemExit("APP_ID is not set in .env file.")
 
-    def _headers(self) -> Dict[str, str]:
-        """Get request headers with authorization."""
-        return {
+        # API calls share one authenticated keep-alive session.
+        self.session = _create_session()
+        self.session.headers.update({
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
-        }
+        })
+
+        # Segment URLs are pre-signed and must not carry the API token.
+        self.download_session = _create_session(DOWNLOAD_POOL_MAXSIZE)
+
+        # GET responses, keyed by (url, params): (fetched_at, data)
+        self._cache: Dict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]] = {}
+
+    def __enter__(self) -> AppStoreClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+        self.download_session.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        self._cache.clear()
 
     def _get(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request to API."""
-        response = requests.get(
+        """Make GET request to API, reusing responses up to CACHE_TTL old."""
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1]
+
+        response = self.session.get(
             url,
-            headers=self._headers(),
             params=params,
             timeout=DEFAULT_TIMEOUT
         )
         if not response.ok:
             raise Exception(f"API error {response.status_code}: {response.text}")
-        return response.json()
+        data = _decode_json(response)
+        self._cache[key] = (time.monotonic(), data)
+        return data
 
     def _post(self, url: str, payload: Dict) -> Dict[str, Any]:
         """Make POST request to API."""
-        response = requests.post(
+        # A write may change what list endpoints return
+        self.clear_cache()
+        response = self.session.post(
             url,
-            headers=self._headers(),
             json=payload,
             timeout=DEFAULT_TIMEOUT
         )
         if not response.ok:
             raise Exception(f"API error {response.status_code}: {response.text}")
-        return response.json()
+        return _decode_json(response)
 
     # -------------------------------------------------------------------------
     # Report Requests
@@ -201,25 +302,39 @@ class AppStoreClient:
         Returns:
             Path to the downloaded file
         """
-        response = requests.get(download_url, timeout=DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
-
-        # Check if content is gzipped
-        is_gzipped = (
-            download_url.endswith('.gz') or
-            response.headers.get('Content-Type') == 'application/gzip'
-        )
-
-        if is_gzipped:
-            gz_path = output_path.with_suffix('.csv.gz')
-            gz_path.write_bytes(response.content)
-
-            # Decompress
-            with gzip.open(gz_path, 'rb') as f_in:
-                output_path.write_bytes(f_in.read())
-            gz_path.unlink()
-        else:
-            output_path.write_bytes(response.content)
+        with self.download_session.get(
+            download_url,
+            stream=True,
+            timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+
+            # Check if content is gzipped
+            is_gzipped = (
+                download_url.endswith('.gz') or
+                response.headers.get('Content-Type') == 'application/gzip'
+            )
+
+            # Undo any transport Content-Encoding, as response.content would
+            response.raw.decode_content = True
+            # Keep the raw stream readable at EOF for BufferedReader
+            response.raw.auto_close = False
+
+            content_length = int(response.headers.get('Content-Length') or 0)
+            use_pigz = (
+                is_gzipped and PIGZ_PATH is not None and
+                content_length >= PIGZ_MIN_SIZE
+            )
+
+            with output_path.open('wb', buffering=COPY_CHUNK_SIZE) as f_out:
+                if use_pigz:
+                    _pigz_decompress(response.raw, f_out)
+                elif is_gzipped:
+                    raw = io.BufferedReader(response.raw, buffer_size=COPY_CHUNK_SIZE)
+                    with gzip.GzipFile(fileobj=raw) as f_in:
+                        shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
+                else:
+                    shutil.copyfileobj(response.raw, f_out, COPY_CHUNK_SIZE)
 
         return output_path
 
@@ -232,6 +347,11 @@ class AppStoreClient:
         """
         Download all segments of a report instance.
 
+        Large reports are split into several segments. These are fetched
+        in parallel and joined, in API order, into a single file. The file
+        only appears under its final name once complete, so an existing
+        file is never a partial download.
+
         Args:
             instance_id: The instance ID
             output_dir: Directory to save the file
@@ -241,21 +361,98 @@ class AppStoreClient:
             Path to the downloaded file, or None if no segments
         """
         segments = self.get_segments(instance_id)
-        if not segments:
+        urls = [
+            segment.get("attributes", {}).get("url")
+            for segment in segments
+        ]
+        urls = [url for url in urls if url]
+        if not urls:
             return None
 
         output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / filename
+        tmp_path = output_dir / f"{filename}.tmp"
+
+        part_paths = [
+            output_dir / f"{filename}.part{n}"
+            for n in range(len(urls))
+        ]
+        try:
+            if len(urls) == 1:
+                self.download_segment(urls[0], tmp_path)
+            else:
+                workers = min(SEGMENT_WORKERS, len(urls))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(self.download_segment, urls, part_paths))
+                _join_segments(part_paths, tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
+            tmp_path.unlink(missing_ok=True)
 
-        for segment in segments:
-            attrs = segment.get("attributes", {})
-            download_url = attrs.get("url")
-            if not download_url:
-                continue
+        return output_path
 
-            output_path = output_dir / filename
-            return self.download_segment(download_url, output_path)
 
-        return None
+@functools.lru_cache(maxsize=1)
+def get_client(token: Optional[str] = None) -> AppStoreClient:
+    """
+    Get the shared App Store Connect client for this process.
+
+    The client owns the pooled sessions, retry policy, response cache
+    and token, so every caller reuses them. It is safe to use from
+    several threads: requests.Session handles concurrent requests, and
+    the connection pools are sized for the CLI's worker counts.
+
+    Args:
+        token: Optional JWT token. If not provided, generates a new one.
+
+    Returns:
+        The shared AppStoreClient
+    """
+    return AppStoreClient(token)
+
+
+def _pigz_decompress(f_in: BinaryIO, f_out: BinaryIO) -> None:
+    """Decompress a gzip stream into a file through an external pigz process."""
+    f_out.flush()
+    process = subprocess.Popen(
+        [PIGZ_PATH, "-d", "-c"],
+        stdin=subprocess.PIPE,
+        stdout=f_out,
+    )
+    try:
+        shutil.copyfileobj(f_in, process.stdin, COPY_CHUNK_SIZE)
+    except BrokenPipeError:
+        # pigz exited early; its status is reported below
+        pass
+    finally:
+        process.stdin.close()
+        returncode = process.wait()
+
+    if returncode != 0:
+        raise Exception(f"pigz exited with status {returncode}")
+
+
+def _join_segments(part_paths: List[Path], output_path: Path) -> None:
+    """Concatenate segment files, keeping only the first header row."""
+    header: Optional[bytes] = None
+    with output_path.open("wb", buffering=COPY_CHUNK_SIZE) as f_out:
+        for part_path in part_paths:
+            with part_path.open("rb") as f_in:
+                first_line = f_in.readline()
+                if header is None:
+                    header = first_line
+                    f_out.write(first_line)
+                elif first_line != header:
+                    f_out.write(first_line)
+                shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
+
+                # Keep rows from adjacent segments on separate lines
+                if f_in.tell() > 0:
+                    f_in.seek(-1, os.SEEK_END)
+                    if f_in.read(1) != b"\n":
+                        f_out.write(b"\n")
 
 
 # -----------------------------------------------------------------------------
@@ -272,21 +469,76 @@ def get_date_range(file_path: Path) -> Tuple[str, str]:
     Returns:
         Tuple of (oldest_date, newest_date) or ("-", "-") if not found
     """
-    dates: Set[str] = set()
+    oldest, newest, _ = get_report_stats(file_path)
+    return oldest, newest
+
+
+def get_report_stats(file_path: Path) -> Tuple[str, str, int]:
+    """
+    Extract the date range and line count of a CSV report in one pass.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        Tuple of (oldest_date, newest_date, line_count); dates are "-"
+        if not found
+    """
+    oldest: Optional[bytes] = None
+    newest: Optional[bytes] = None
+    lines = 0
     try:
-        with file_path.open(encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-            for row in reader:
-                date_val = row.get("Date", "")
-                if date_val and date_val[0].isdigit():
-                    dates.add(date_val)
-    except Exception:
+        with file_path.open("rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            nl = mm.find(b"\n")
+            if nl < 0:
+                nl = end
+            lines = 1
+            header = mm[:nl].lstrip(UTF8_BOM).rstrip(b"\r").split(b"\t")
+            idx = header.index(b"Date") if b"Date" in header else None
+
+            pos = nl + 1
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl < 0:
+                    nl = end
+                lines += 1
+
+                if idx is None:
+                    pos = nl + 1
+                    continue
+
+                # Skip to the Date field without splitting the whole line
+                start = pos
+                for _ in range(idx):
+                    tab = mm.find(b"\t", start, nl)
+                    if tab < 0:
+                        break
+                    start = tab + 1
+                else:
+                    stop = mm.find(b"\t", start, nl)
+                    if stop < 0:
+                        stop = nl
+                    date_val = mm[start:stop].rstrip(b"\r")
+
+                    # ISO dates compare lexicographically, so track only the ends
+                    if date_val[:1].isdigit():
+                        if oldest is None or date_val < oldest:
+                            oldest = date_val
+                        if newest is None or date_val > newest:
+                            newest = date_val
+
+                pos = nl + 1
+    except (OSError, ValueError):
+        # Missing, unreadable or empty file (mmap rejects zero length)
         pass
 
-    if dates:
-        sorted_dates = sorted(dates)
-        return sorted_dates[0], sorted_dates[-1]
-    return "-", "-"
+    return (
+        oldest.decode("utf-8") if oldest else "-",
+        newest.decode("utf-8") if newest else "-",
+        lines,
+    )
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -1,8 +1,9 @@
 """
 Authentication module for App Store Connect API.
 
-This module handles JWT token generation for authenticating with the
-App Store Connect API. Tokens are valid for 20 minutes.
+This module handles ES256 JWT token generation for authenticating with the
+App Store Connect API. Tokens are valid for 20 minutes and are cached
+on disk so repeated CLI runs reuse a still-valid token.
 
 Usage:
     from auth import generate_token
@@ -11,41 +12,114 @@ Usage:
 
 from __future__ import annotations
 
+import base64
+import functools
+import json
 import os
+import tempfile
 import time
 from pathlib import Path
+from typing import Any, Optional
 
-import jwt
-from dotenv import load_dotenv
-
-# Load environment variables
 PROJECT_ROOT = Path(__file__).resolve().parent
-load_dotenv(PROJECT_ROOT / ".env")
+
+# Token settings
+TOKEN_LIFETIME = 1200  # 20 minutes
+TOKEN_REFRESH_MARGIN = 600  # clients never re-sign, so leave room for a full run
+TOKEN_CACHE_FILE = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "indlovu"
+    / "token.json"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from the project .env file (once)."""
+    from dotenv import load_dotenv
+
+    load_dotenv(PROJECT_ROOT / ".env")
 
 
 def _require_env(name: str) -> str:
     """Get required environment variable or exit with error."""
+    _load_env()
     value = os.getenv(name)
     if not value:
         raise SystemExit(f"Environment variable {name} is not set. Check your .env file.")
     return value
 
 
-def _load_private_key(path: str) -> str:
-    """Load private key from file."""
+@functools.lru_cache(maxsize=4)
+def _load_private_key(path: str) -> bytes:
+    """Load private key from file (read once per path)."""
     key_path = Path(path)
     if not key_path.is_absolute():
         key_path = PROJECT_ROOT / key_path
     if not key_path.exists():
         raise SystemExit(f"Private key file not found: {key_path}")
-    return key_path.read_text()
+    return key_path.read_bytes()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_signing_key(path: str) -> Any:
+    """Load and parse the EC private key once per path."""
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_private_key(_load_private_key(path), password=None)
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_json(data: dict) -> bytes:
+    """Serialize a JWT header or payload segment."""
+    return _b64url(json.dumps(data, separators=(",", ":")).encode())
+
+
+def _read_cached_token(issuer: str, key_id: str) -> Optional[str]:
+    """Return the cached token if it belongs to this key and is still valid."""
+    try:
+        data = json.loads(TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    if data.get("iss") != issuer or data.get("kid") != key_id:
+        return None
+    if data.get("exp", 0) <= time.time() + TOKEN_REFRESH_MARGIN:
+        return None
+    return data.get("token")
+
+
+def _write_cached_token(token: str, exp: int, issuer: str, key_id: str) -> None:
+    """Atomically save a token to the cache file (readable by owner only)."""
+    try:
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=TOKEN_CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "exp": exp, "iss": issuer, "kid": key_id}, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, TOKEN_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Caching is best-effort; a fresh token is signed next time.
+        pass
 
 
 def generate_token() -> str:
     """
     Generate a JWT token for App Store Connect API authentication.
 
-    The token is valid for 20 minutes and uses ES256 algorithm.
+    The token is valid for 20 minutes and uses ES256 algorithm. A cached
+    token for the same issuer and key is reused while it has more than
+    ten minutes of validity left.
 
     Required environment variables:
         - ISSUER_ID: Your App Store Connect Issuer ID
@@ -60,21 +134,37 @@ def generate_token() -> str:
     """
     issuer = _require_env("ISSUER_ID")
     key_id = _require_env("KEY_ID")
+
+    cached = _read_cached_token(issuer, key_id)
+    if cached:
+        return cached
+
+    # Signing dependencies are only needed on a cache miss
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, utils
+
     private_key_path = _require_env("PRIVATE_KEY_PATH")
-    private_key = _load_private_key(private_key_path)
+    private_key = _load_signing_key(private_key_path)
 
+    now = int(time.time())
     payload = {
         "iss": issuer,
-        "iat": int(time.time()),
-        "exp": int(time.time()) + 1200,  # 20 minutes
+        "iat": now,
+        "exp": now + TOKEN_LIFETIME,
         "aud": "appstoreconnect-v1",
     }
     headers = {"alg": "ES256", "kid": key_id, "typ": "JWT"}
 
-    token = jwt.encode(payload, private_key, algorithm="ES256", headers=headers)
-    if isinstance(token, bytes):
-        token = token.decode()
+    signing_input = _b64url_json(headers) + b"." + _b64url_json(payload)
+    der_signature = private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+
+    # JWS wants the raw 64-byte R || S form, not DER
+    r, s = utils.decode_dss_signature(der_signature)
+    signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    token = (signing_input + b"." + _b64url(signature)).decode()
 
+    _write_cached_token(token, payload["exp"], issuer, key_id)
     return token
 
 
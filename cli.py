@@ -16,13 +16,14 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
-from appstore_api import AppStoreClient, get_date_range, format_file_size
+from appstore_api import DOWNLOAD_WORKERS, AppStoreClient, get_client, get_date_range, format_file_size
 
 load_dotenv()
 
@@ -42,6 +43,13 @@ REPORTS_CONFIG = [
     ("r15", ["DAILY", "WEEKLY", "MONTHLY"], "discovery_detailed_{granularity}.csv", "Discovery Detailed {Granularity}"),
 ]
 
+# Flattened download jobs: (report_id_prefix, granularity, filename)
+REPORT_JOBS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (prefix, granularity, filename_tpl.format(granularity=granularity.lower()))
+    for prefix, granularities, filename_tpl, _ in REPORTS_CONFIG
+    for granularity in granularities
+)
+
 
 def print_header(text: str) -> None:
     """Print a formatted header."""
@@ -117,46 +125,79 @@ def download_instance(client: AppStoreClient, instance_id: str, output_dir: Path
         print("  No segments found for this instance.")
 
 
+def _download_latest(
+    client: AppStoreClient,
+    instances: List[Dict[str, Any]],
+    filename: str,
+    output_dir: Path
+) -> Tuple[Optional[Path], str]:
+    """
+    Download the latest of a report's instances.
+
+    Returns:
+        Tuple of (downloaded path or None, status message)
+    """
+    result = client.download_instance(instances[0]["id"], output_dir, filename)
+    if not result:
+        return None, "No segments available"
+
+    size = format_file_size(result.stat().st_size)
+    oldest, newest = get_date_range(result)
+    return result, f"Saved: {filename} ({size}) [{oldest} to {newest}]"
+
+
 def download_all_reports(
     client: AppStoreClient,
     request_id: str,
     output_dir: Path
 ) -> List[Path]:
-    """Download all configured reports."""
+    """
+    Download all configured reports.
+
+    Instance lookups for every report are issued up front; each download
+    is queued on the same pool as soon as its instances are known.
+    """
     print_header("Downloading All Reports")
     print(f"Output directory: {output_dir}\n")
 
     downloaded: List[Path] = []
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for prefix, granularities, filename_tpl, _ in REPORTS_CONFIG:
-        report_id = f"{prefix}-{request_id}"
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        # Stage 1: instance metadata
+        lookups = {
+            executor.submit(client.get_instances, f"{prefix}-{request_id}", granularity): filename
+            for prefix, granularity, filename in REPORT_JOBS
+        }
+
+        # Stage 2: downloads, started as lookups finish
+        downloads = {}
+        for lookup in as_completed(lookups):
+            filename = lookups[lookup]
+            try:
+                instances = lookup.result()
+            except Exception as e:
+                print(f"Downloading: {filename}...")
+                print(f"  Error: {e}")
+                continue
+
+            if not instances:
+                print(f"Downloading: {filename}...")
+                print("  No instances available")
+                continue
 
-        for granularity in granularities:
-            filename = filename_tpl.format(granularity=granularity.lower())
+            download = executor.submit(_download_latest, client, instances, filename, output_dir)
+            downloads[download] = filename
+
+        for future in as_completed(downloads):
+            filename = downloads[future]
             print(f"Downloading: {filename}...")
 
             try:
-                instances = client.get_instances(report_id, granularity)
-                if not instances:
-                    print("  No instances available")
-                    continue
-
-                instance = instances[0]
-                result = client.download_instance(
-                    instance["id"],
-                    output_dir,
-                    filename
-                )
-
+                result, message = future.result()
+                print(f"  {message}")
                 if result:
-                    size = format_file_size(result.stat().st_size)
-                    oldest, newest = get_date_range(result)
-                    print(f"  Saved: {filename} ({size}) [{oldest} to {newest}]")
                     downloaded.append(result)
-                else:
-                    print("  No segments available")
-
             except Exception as e:
                 print(f"  Error: {e}")
 
@@ -272,7 +313,7 @@ Examples:
     )
 
     args = parser.parse_args()
-    client = AppStoreClient()
+    client = get_client()
 
     # Execute action
     if args.list_requests:
@@ -4,24 +4,39 @@ Firebase Analytics client via BigQuery.
 This module fetches analytics data from Firebase exports
 in BigQuery and provides aggregated metrics.
 
+Queries read a single events table partitioned by a DATE event_date
+and clustered by event_name, user_pseudo_id (see README), rather than
+the daily events_* shards, so BigQuery prunes by partition. DAU, event
+and user-property reports read incrementally maintained materialized
+views, and retention reads a rollup table. All unique-user counts use
+HyperLogLog (APPROX_COUNT_DISTINCT or merged HLL sketches) and are
+therefore approximate.
+
 Usage:
     from firebase_analytics import FirebaseAnalytics
 
     analytics = FirebaseAnalytics()
     events = analytics.get_events_summary(days=30)
     dau = analytics.get_daily_active_users(days=30)
+
+Results are returned as pyarrow Tables read through the BigQuery
+Storage API.
 """
 
 from __future__ import annotations
 
 import csv
+import functools
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import pyarrow as pa
 from dotenv import load_dotenv
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 from google.oauth2 import service_account
 
 load_dotenv()
@@ -30,6 +45,34 @@ load_dotenv()
 GOOGLE_CREDENTIALS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "google_credentials.json")
 FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID", "")
 FIREBASE_ANALYTICS_DATASET = os.getenv("FIREBASE_ANALYTICS_DATASET", "")
+FIREBASE_EVENTS_TABLE = os.getenv("FIREBASE_EVENTS_TABLE", "events")
+
+# Rollups over the events table (created by FirebaseAnalytics.create_rollups)
+DAILY_USERS_VIEW = "mv_daily_users"
+EVENTS_SUMMARY_VIEW = "mv_events_summary"
+USER_PROPERTIES_VIEW = "mv_user_properties"
+RETENTION_TABLE = "cohort_retention"
+FIRST_VISIT_TABLE = "dim_user_first_visit"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_bq_clients(
+    credentials_file: str,
+    project_id: str
+) -> Tuple[bigquery.Client, bigquery_storage.BigQueryReadClient]:
+    """
+    Build authorized BigQuery and Storage Read clients, once per process.
+
+    Instances with the same credentials and project share the clients,
+    and with them the credentials' OAuth token and HTTP session.
+    """
+    credentials = service_account.Credentials.from_service_account_file(
+        credentials_file,
+        scopes=["https://www.googleapis.com/auth/bigquery"]
+    )
+    client = bigquery.Client(credentials=credentials, project=project_id)
+    bqstorage = bigquery_storage.BigQueryReadClient(credentials=credentials)
+    return client, bqstorage
 
 
 class FirebaseAnalytics:
@@ -39,7 +82,8 @@ class FirebaseAnalytics:
         self,
         credentials_file: Optional[str] = None,
         project_id: Optional[str] = None,
-        dataset: Optional[str] = None
+        dataset: Optional[str] = None,
+        events_table: Optional[str] = None
     ):
         """
         Initialize Firebase Analytics client.
@@ -48,10 +92,13 @@ class FirebaseAnalytics:
             credentials_file: Path to service account JSON file
             project_id: Firebase/GCP project ID
             dataset: BigQuery dataset name for analytics
+            events_table: Partitioned events table name within the dataset
         """
         self.credentials_file = credentials_file or GOOGLE_CREDENTIALS_FILE
         self.project_id = project_id or FIREBASE_PROJECT_ID
         self.dataset = dataset or FIREBASE_ANALYTICS_DATASET
+        self.events_table = events_table or FIREBASE_EVENTS_TABLE
+        self.table = f"{self.project_id}.{self.dataset}.{self.events_table}"
 
         if not Path(self.credentials_file).exists():
             raise SystemExit(
@@ -60,17 +107,14 @@ class FirebaseAnalytics:
             )
 
         self._client: Optional[bigquery.Client] = None
+        self._bqstorage: Optional[bigquery_storage.BigQueryReadClient] = None
 
     def _connect(self) -> bigquery.Client:
-        """Establish connection to BigQuery."""
+        """Establish connection to BigQuery and the Storage Read API."""
         if self._client is None:
-            credentials = service_account.Credentials.from_service_account_file(
+            self._client, self._bqstorage = _get_bq_clients(
                 self.credentials_file,
-                scopes=["https://www.googleapis.com/auth/bigquery"]
-            )
-            self._client = bigquery.Client(
-                credentials=credentials,
-                project=self.project_id
+                self.project_id
             )
         return self._client
 
@@ -79,20 +123,274 @@ class FirebaseAnalytics:
         """Get BigQuery client, connecting if necessary."""
         return self._connect()
 
-    def _run_query(self, query: str) -> List[Dict[str, Any]]:
-        """Run a BigQuery query and return results as list of dicts."""
+    def _run_query(
+        self,
+        query: str,
+        params: Optional[List[bigquery.ScalarQueryParameter]] = None
+    ) -> pa.Table:
+        """
+        Run a BigQuery query and return results as an Arrow table.
+
+        Uses the jobs.query fast path, so short queries finish in a single
+        round trip and small results come back inline with the response.
+        Larger results are read in columnar batches over the Storage Read
+        API instead of paging JSON through tabledata.list.
+        """
         try:
-            result = self.client.query(query).result()
-            return [dict(row) for row in result]
+            rows = self._query_and_wait(query, params)
+            return rows.to_arrow(bqstorage_client=self._bqstorage)
         except Exception as e:
             print(f"Query error: {e}")
-            return []
+            return pa.table({})
+
+    def _query_and_wait(
+        self,
+        query: str,
+        params: Optional[List[bigquery.ScalarQueryParameter]]
+    ) -> bigquery.table.RowIterator:
+        """Run a query through the jobs.query fast path."""
+        # Identical SQL + parameters hit BigQuery's 24h result cache
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=params or [],
+            use_query_cache=True
+        )
+        return self.client.query_and_wait(query, job_config=job_config)
+
+    def events_last_modified(self) -> Optional[datetime]:
+        """
+        Get when any partition of the events table was last modified.
+
+        Reads partition metadata only, so no event data is scanned.
+
+        Returns:
+            Latest partition modification time (UTC), or None if unknown
+        """
+        query = f"""
+        SELECT MAX(last_modified_time) as last_modified
+        FROM `{self.project_id}.{self.dataset}.INFORMATION_SCHEMA.PARTITIONS`
+        WHERE table_name = @table_name
+        """
+        result = self._run_query(query, [
+            bigquery.ScalarQueryParameter("table_name", "STRING", self.events_table),
+        ])
+        if not result.num_rows:
+            return None
+        return result.column(0)[0].as_py()
+
+    def export_query_to_gcs(self, query: str, gcs_uri: str) -> bool:
+        """
+        Export query results straight to Cloud Storage as tab-delimited CSV.
+
+        BigQuery writes the shards in parallel on the server, so the rows
+        never pass through this process.
+
+        Args:
+            query: SQL SELECT statement to export
+            gcs_uri: Destination URI with one wildcard, e.g. gs://bucket/events-*.csv
+
+        Returns:
+            True if the export job succeeded
+        """
+        if gcs_uri.count("*") != 1:
+            raise ValueError(f"GCS URI must contain exactly one '*' wildcard: {gcs_uri}")
+        # OPTIONS values cannot be query parameters, so the URI is inlined
+        if not gcs_uri.startswith("gs://") or "'" in gcs_uri or "\\" in gcs_uri:
+            raise ValueError(f"Invalid GCS URI: {gcs_uri}")
+
+        export = f"""
+        EXPORT DATA OPTIONS (
+            uri = '{gcs_uri}',
+            format = 'CSV',
+            overwrite = true,
+            header = true,
+            field_delimiter = '\\t'
+        ) AS
+        {query}
+        """
+        try:
+            self.client.query(export).result()
+            return True
+        except Exception as e:
+            print(f"Export error: {e}")
+            return False
+
+    # -------------------------------------------------------------------------
+    # Rollups
+    # -------------------------------------------------------------------------
+
+    def _rollup(self, name: str) -> str:
+        """Get the fully qualified name of a rollup view or table."""
+        return f"{self.project_id}.{self.dataset}.{name}"
+
+    def create_rollups(self) -> bool:
+        """
+        Create the materialized views the reports read from.
+
+        Views are maintained incrementally by BigQuery, so this only
+        needs to run once per dataset. Also creates the first-visit
+        dimension table and builds the retention table.
+
+        Returns:
+            True if all statements succeeded
+        """
+        statements = [
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS `{self._rollup(DAILY_USERS_VIEW)}`
+            PARTITION BY event_date
+            AS
+            SELECT
+                event_date,
+                APPROX_COUNT_DISTINCT(user_pseudo_id) as active_users,
+                COUNT(*) as total_events
+            FROM `{self.table}`
+            GROUP BY event_date
+            """,
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS `{self._rollup(EVENTS_SUMMARY_VIEW)}`
+            PARTITION BY event_date
+            CLUSTER BY event_name
+            AS
+            SELECT
+                event_date,
+                event_name,
+                COUNT(*) as event_count,
+                HLL_COUNT.INIT(user_pseudo_id) as users_sketch
+            FROM `{self.table}`
+            GROUP BY event_date, event_name
+            """,
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS `{self._rollup(USER_PROPERTIES_VIEW)}`
+            PARTITION BY event_date
+            AS
+            SELECT
+                event_date,
+                device.category as device_category,
+                device.operating_system as os,
+                device.operating_system_version as os_version,
+                geo.country as country,
+                HLL_COUNT.INIT(user_pseudo_id) as users_sketch
+            FROM `{self.table}`
+            GROUP BY event_date, device_category, os, os_version, country
+            """,
+            f"""
+            CREATE TABLE IF NOT EXISTS `{self._rollup(FIRST_VISIT_TABLE)}` (
+                user_pseudo_id STRING,
+                first_visit_date DATE
+            )
+            PARTITION BY first_visit_date
+            CLUSTER BY user_pseudo_id
+            """,
+        ]
+        try:
+            for statement in statements:
+                self.client.query(statement).result()
+        except Exception as e:
+            print(f"Rollup error: {e}")
+            return False
+        return self.refresh_retention()
+
+    def refresh_retention(self) -> bool:
+        """
+        Rebuild the cohort retention table from the last 90 days of events.
+
+        New users are first merged into the first-visit dimension table,
+        scanning only events since three days before its latest
+        first_visit_date. Daily shards keep changing for up to 72 hours,
+        so late events can still add a user or move a first visit
+        earlier. The retention table then joins that small table against the events
+        table, keeping only the activity days that are reported.
+        Materialized views cannot express the cohort join, so this runs
+        on a schedule (the weekly sync runs it first).
+
+        Returns:
+            True if the table was rebuilt
+        """
+        first_visits = self._rollup(FIRST_VISIT_TABLE)
+        query = f"""
+        DECLARE since DATE DEFAULT (
+            SELECT IFNULL(MAX(first_visit_date), DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY))
+            FROM `{first_visits}`
+        );
+
+        -- Rows with no user id, added by earlier runs, never join
+        DELETE FROM `{first_visits}` WHERE user_pseudo_id IS NULL;
+
+        MERGE `{first_visits}` T
+        USING (
+            SELECT
+                user_pseudo_id,
+                MIN(event_date) as first_visit_date
+            FROM `{self.table}`
+            WHERE event_date >= DATE_SUB(since, INTERVAL 3 DAY)
+                AND user_pseudo_id IS NOT NULL
+            GROUP BY user_pseudo_id
+        ) S
+        ON T.user_pseudo_id = S.user_pseudo_id
+        WHEN MATCHED AND S.first_visit_date < T.first_visit_date THEN
+            UPDATE SET first_visit_date = S.first_visit_date
+        WHEN NOT MATCHED THEN
+            INSERT (user_pseudo_id, first_visit_date)
+            VALUES (S.user_pseudo_id, S.first_visit_date);
+
+        CREATE OR REPLACE TABLE `{self._rollup(RETENTION_TABLE)}` AS
+        WITH user_activity AS (
+            SELECT
+                e.user_pseudo_id,
+                fv.first_visit_date,
+                DATE_DIFF(e.event_date, fv.first_visit_date, DAY) as days_since_first
+            FROM `{self.table}` e
+            JOIN `{first_visits}` fv USING (user_pseudo_id)
+            WHERE e.event_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY)
+                AND fv.first_visit_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY)
+                AND DATE_DIFF(e.event_date, fv.first_visit_date, DAY) IN (0, 1, 7, 14, 30)
+        )
+        SELECT
+            first_visit_date as cohort_date,
+            APPROX_COUNT_DISTINCT(user_pseudo_id) as cohort_size,
+            APPROX_COUNT_DISTINCT(CASE WHEN days_since_first = 1 THEN user_pseudo_id END) as day_1,
+            APPROX_COUNT_DISTINCT(CASE WHEN days_since_first = 7 THEN user_pseudo_id END) as day_7,
+            APPROX_COUNT_DISTINCT(CASE WHEN days_since_first = 14 THEN user_pseudo_id END) as day_14,
+            APPROX_COUNT_DISTINCT(CASE WHEN days_since_first = 30 THEN user_pseudo_id END) as day_30
+        FROM user_activity
+        GROUP BY cohort_date;
+        """
+        try:
+            self.client.query(query).result()
+            return True
+        except Exception as e:
+            print(f"Rollup error: {e}")
+            return False
+
+    # -------------------------------------------------------------------------
+    # Reports
+    # -------------------------------------------------------------------------
+
+    def _run_window_query(
+        self,
+        query: str,
+        days: int,
+        limit: Optional[int] = None
+    ) -> pa.Table:
+        """
+        Run a report query over the last `days` days.
+
+        Binds @start_date and @end_date (and @limit, if given), so the
+        SQL text stays identical across runs and the result cache applies.
+        """
+        end_date = date.today()
+        params = [
+            bigquery.ScalarQueryParameter("start_date", "DATE", end_date - timedelta(days=days)),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]
+        if limit is not None:
+            params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
+        return self._run_query(query, params)
 
     def get_events_summary(
         self,
         days: int = 30,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> pa.Table:
         """
         Get summary of Firebase Analytics events.
 
@@ -101,29 +399,24 @@ class FirebaseAnalytics:
             limit: Maximum number of event types to return
 
         Returns:
-            List of event summaries with counts
+            Table of event summaries with counts
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
         query = f"""
         SELECT
             event_name,
-            COUNT(*) as event_count,
-            COUNT(DISTINCT user_pseudo_id) as unique_users,
-            MIN(PARSE_DATE('%Y%m%d', event_date)) as first_seen,
-            MAX(PARSE_DATE('%Y%m%d', event_date)) as last_seen
-        FROM `{self.project_id}.{self.dataset}.events_*`
-        WHERE _TABLE_SUFFIX BETWEEN
-            FORMAT_DATE('%Y%m%d', DATE('{start_date.strftime('%Y-%m-%d')}'))
-            AND FORMAT_DATE('%Y%m%d', DATE('{end_date.strftime('%Y-%m-%d')}'))
+            SUM(event_count) as event_count,
+            HLL_COUNT.MERGE(users_sketch) as unique_users,
+            MIN(event_date) as first_seen,
+            MAX(event_date) as last_seen
+        FROM `{self._rollup(EVENTS_SUMMARY_VIEW)}`
+        WHERE event_date BETWEEN @start_date AND @end_date
         GROUP BY event_name
         ORDER BY event_count DESC
-        LIMIT {limit}
+        LIMIT @limit
         """
-        return self._run_query(query)
+        return self._run_window_query(query, days, limit=limit)
 
-    def get_daily_active_users(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_daily_active_users(self, days: int = 30) -> pa.Table:
         """
         Get daily active users over time.
 
@@ -131,69 +424,42 @@ class FirebaseAnalytics:
             days: Number of days to look back
 
         Returns:
-            List of daily user counts
+            Table of daily user counts
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
         query = f"""
         SELECT
-            PARSE_DATE('%Y%m%d', event_date) as date,
-            COUNT(DISTINCT user_pseudo_id) as active_users,
-            COUNT(*) as total_events
-        FROM `{self.project_id}.{self.dataset}.events_*`
-        WHERE _TABLE_SUFFIX BETWEEN
-            FORMAT_DATE('%Y%m%d', DATE('{start_date.strftime('%Y-%m-%d')}'))
-            AND FORMAT_DATE('%Y%m%d', DATE('{end_date.strftime('%Y-%m-%d')}'))
-        GROUP BY event_date
+            event_date as date,
+            active_users,
+            total_events
+        FROM `{self._rollup(DAILY_USERS_VIEW)}`
+        WHERE event_date BETWEEN @start_date AND @end_date
         ORDER BY event_date DESC
         """
-        return self._run_query(query)
+        return self._run_window_query(query, days)
 
-    def get_user_retention(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_user_retention(self, days: int = 30) -> pa.Table:
         """
         Get user retention by first visit cohort.
 
+        Reads the table built by refresh_retention().
+
         Args:
             days: Number of days to analyze
 
         Returns:
-            List of retention metrics by cohort
+            Table of retention metrics by cohort
         """
         query = f"""
-        WITH first_visits AS (
-            SELECT
-                user_pseudo_id,
-                MIN(PARSE_DATE('%Y%m%d', event_date)) as first_visit_date
-            FROM `{self.project_id}.{self.dataset}.events_*`
-            WHERE _TABLE_SUFFIX >= FORMAT_DATE('%Y%m%d', DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY))
-            GROUP BY user_pseudo_id
-        ),
-        user_activity AS (
-            SELECT
-                e.user_pseudo_id,
-                fv.first_visit_date,
-                PARSE_DATE('%Y%m%d', e.event_date) as activity_date,
-                DATE_DIFF(PARSE_DATE('%Y%m%d', e.event_date), fv.first_visit_date, DAY) as days_since_first
-            FROM `{self.project_id}.{self.dataset}.events_*` e
-            JOIN first_visits fv ON e.user_pseudo_id = fv.user_pseudo_id
-            WHERE _TABLE_SUFFIX >= FORMAT_DATE('%Y%m%d', DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY))
-        )
-        SELECT
-            first_visit_date as cohort_date,
-            COUNT(DISTINCT user_pseudo_id) as cohort_size,
-            COUNT(DISTINCT CASE WHEN days_since_first = 1 THEN user_pseudo_id END) as day_1,
-            COUNT(DISTINCT CASE WHEN days_since_first = 7 THEN user_pseudo_id END) as day_7,
-            COUNT(DISTINCT CASE WHEN days_since_first = 14 THEN user_pseudo_id END) as day_14,
-            COUNT(DISTINCT CASE WHEN days_since_first = 30 THEN user_pseudo_id END) as day_30
-        FROM user_activity
-        GROUP BY cohort_date
+        SELECT *
+        FROM `{self._rollup(RETENTION_TABLE)}`
         ORDER BY cohort_date DESC
-        LIMIT {days}
+        LIMIT @days
         """
-        return self._run_query(query)
+        return self._run_query(query, [
+            bigquery.ScalarQueryParameter("days", "INT64", days),
+        ])
 
-    def get_screen_views(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_screen_views(self, days: int = 30) -> pa.Table:
         """
         Get screen view counts.
 
@@ -201,29 +467,25 @@ class FirebaseAnalytics:
             days: Number of days to look back
 
         Returns:
-            List of screen views with counts
+            Table of screen views with counts
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
+        # Filter on the clustering column before UNNEST touches any rows
         query = f"""
         SELECT
             (SELECT value.string_value FROM UNNEST(event_params) WHERE key = 'firebase_screen') as screen_name,
             COUNT(*) as view_count,
-            COUNT(DISTINCT user_pseudo_id) as unique_users
-        FROM `{self.project_id}.{self.dataset}.events_*`
+            APPROX_COUNT_DISTINCT(user_pseudo_id) as unique_users
+        FROM `{self.table}`
         WHERE event_name = 'screen_view'
-            AND _TABLE_SUFFIX BETWEEN
-                FORMAT_DATE('%Y%m%d', DATE('{start_date.strftime('%Y-%m-%d')}'))
-                AND FORMAT_DATE('%Y%m%d', DATE('{end_date.strftime('%Y-%m-%d')}'))
+            AND event_date BETWEEN @start_date AND @end_date
         GROUP BY screen_name
         HAVING screen_name IS NOT NULL
         ORDER BY view_count DESC
         LIMIT 50
         """
-        return self._run_query(query)
+        return self._run_window_query(query, days)
 
-    def get_user_properties(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_user_properties(self, days: int = 30) -> pa.Table:
         """
         Get aggregated user properties.
 
@@ -231,65 +493,97 @@ class FirebaseAnalytics:
             days: Number of days to look back
 
         Returns:
-            List of user property distributions
+            Table of user property distributions
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
         query = f"""
         SELECT
-            device.category as device_category,
-            device.operating_system as os,
-            device.operating_system_version as os_version,
-            geo.country as country,
-            COUNT(DISTINCT user_pseudo_id) as users
-        FROM `{self.project_id}.{self.dataset}.events_*`
-        WHERE _TABLE_SUFFIX BETWEEN
-            FORMAT_DATE('%Y%m%d', DATE('{start_date.strftime('%Y-%m-%d')}'))
-            AND FORMAT_DATE('%Y%m%d', DATE('{end_date.strftime('%Y-%m-%d')}'))
+            device_category,
+            os,
+            os_version,
+            country,
+            HLL_COUNT.MERGE(users_sketch) as users
+        FROM `{self._rollup(USER_PROPERTIES_VIEW)}`
+        WHERE event_date BETWEEN @start_date AND @end_date
         GROUP BY device_category, os, os_version, country
         ORDER BY users DESC
         LIMIT 100
         """
-        return self._run_query(query)
+        return self._run_window_query(query, days)
+
+    def run_all(self, days: Optional[int] = None) -> Dict[str, pa.Table]:
+        """
+        Run all reports in FIREBASE_REPORTS concurrently.
+
+        Each query blocks only on its own job, so BigQuery executes the
+        jobs in parallel instead of back to back.
+
+        Args:
+            days: Number of days to look back, overriding each report's own
+
+        Returns:
+            Mapping of report method name to its result table
+        """
+        # Connect up front so worker threads share one client
+        self._connect()
+
+        with ThreadPoolExecutor(max_workers=len(FIREBASE_REPORTS)) as executor:
+            futures = {}
+            for method_name, _, _, kwargs in FIREBASE_REPORTS:
+                if days is not None:
+                    kwargs = {**kwargs, "days": days}
+                futures[method_name] = executor.submit(getattr(self, method_name), **kwargs)
+        return {name: future.result() for name, future in futures.items()}
 
     def export_to_csv(
         self,
-        data: List[Dict[str, Any]],
+        data: pa.Table,
         output_path: Path,
         filename: str
     ) -> Optional[Path]:
         """
-        Export data to CSV file.
+        Export data to a tab-delimited CSV file.
+
+        The reports are small, so rows are written with csv.writer. That
+        keeps the archived files in their original format: fields quoted
+        only where needed, CRLF line endings, and dates in ISO format.
 
         Args:
-            data: List of dictionaries to export
+            data: Query result table to export
             output_path: Directory to save file
             filename: Name of the CSV file
 
         Returns:
             Path to created file or None
         """
-        if not data:
+        if not data.num_rows:
             return None
 
         output_path.mkdir(parents=True, exist_ok=True)
         file_path = output_path / filename
 
-        # Convert date objects to strings
-        for row in data:
-            for key, value in row.items():
-                if hasattr(value, 'isoformat'):
-                    row[key] = value.isoformat()
-
+        columns = [column.to_pylist() for column in data.columns]
         with file_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys(), delimiter="\t")
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f, delimiter="\t")
+            writer.writerow(data.column_names)
+            for row in zip(*columns):
+                writer.writerow(
+                    value.isoformat() if hasattr(value, "isoformat") else value
+                    for value in row
+                )
 
         return file_path
 
 
+# Reports exported by the weekly sync:
+# (method_name, filename, description, keyword arguments)
+FIREBASE_REPORTS: Tuple[Tuple[str, str, str, Dict[str, Any]], ...] = (
+    ("get_events_summary", "firebase_events_summary.csv", "Events Summary", {"days": 30}),
+    ("get_daily_active_users", "firebase_daily_users.csv", "Daily Active Users", {"days": 30}),
+    ("get_user_retention", "firebase_retention.csv", "User Retention", {"days": 30}),
+    ("get_screen_views", "firebase_screens.csv", "Screen Views", {"days": 30}),
+    ("get_user_properties", "firebase_user_properties.csv", "User Properties", {"days": 30}),
+)
+
 # Sheet name mappings for Firebase reports
 FIREBASE_SHEET_NAMES: Dict[str, str] = {
     "firebase_events_summary.csv": "Firebase Events",
@@ -14,13 +14,27 @@ Usage:
 from __future__ import annotations
 
 import csv
+import functools
+import gzip
+import itertools
+import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import gspread
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from dotenv import load_dotenv
 from gspread import Spreadsheet, Worksheet
+from gspread.urls import SPREADSHEET_VALUES_BATCH_UPDATE_URL
+from gspread.utils import ValueInputOption, absolute_range_name
+
+# orjson serializes large row payloads several times faster than json; optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
@@ -28,6 +42,123 @@ load_dotenv()
 GOOGLE_CREDENTIALS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "google_credentials.json")
 GOOGLE_SPREADSHEET_ID = os.getenv("GOOGLE_SPREADSHEET_ID", "")
 
+# Rows per values.update call; keeps request bodies well under the API limit
+UPLOAD_CHUNK_ROWS = 10000
+
+# Bytes parsed per Arrow CSV block
+CSV_BLOCK_SIZE = 4 * 1024 * 1024
+
+# With a reports dataset set, reports larger than this are loaded into
+# BigQuery and Sheets gets a preview
+BIGQUERY_LOAD_MIN_SIZE = 1024 * 1024
+SHEETS_PREVIEW_ROWS = 1000
+BIGQUERY_REPORTS_DATASET = os.getenv("BIGQUERY_REPORTS_DATASET", "")
+BIGQUERY_REPORTS_PROJECT = os.getenv("FIREBASE_PROJECT_ID", "")
+
+
+def _open_report(file_path: Path, mode: str = "r") -> IO[Any]:
+    """Open a report for reading; archived *.csv.gz reports are decompressed."""
+    if "b" in mode:
+        kwargs = {}
+    else:
+        kwargs = {"encoding": "utf-8", "newline": ""}
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, mode if "b" in mode else "rt", **kwargs)
+    return file_path.open(mode, **kwargs)
+
+
+def _report_name(file_path: Path) -> str:
+    """Get the report name of a file, without .csv or .csv.gz."""
+    name = file_path.name
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return Path(name).stem
+
+
+def _read_header(file_path: Path) -> List[str]:
+    """Read the header row of a tab-delimited file (empty if no rows)."""
+    with _open_report(file_path) as f:
+        return next(csv.reader(f, delimiter="\t"), [])
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count lines in a file without decoding it (used to size sheets)."""
+    count = 0
+    last = b"\n"
+    with _open_report(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gspread_client(credentials_file: str) -> gspread.Client:
+    """Authorize a gspread client once per credentials file."""
+    return gspread.service_account(filename=credentials_file)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_bigquery_client(credentials_file: str, project_id: str) -> Any:
+    """Authorize a BigQuery client once per credentials file and project."""
+    # Only needed when BIGQUERY_REPORTS_DATASET is set
+    from google.cloud import bigquery
+    from google.oauth2 import service_account
+
+    credentials = service_account.Credentials.from_service_account_file(
+        credentials_file,
+        scopes=["https://www.googleapis.com/auth/bigquery"]
+    )
+    return bigquery.Client(credentials=credentials, project=project_id)
+
+
+def load_csv_to_bigquery(
+    file_path: Path,
+    table_name: str,
+    clustering_fields: Optional[List[str]] = None,
+    credentials_file: Optional[str] = None
+) -> int:
+    """
+    Load a tab-delimited report into a table in BIGQUERY_REPORTS_DATASET.
+
+    The table is replaced on every load, with the schema detected
+    from the file.
+
+    Args:
+        file_path: Path to the tab-delimited file (header row first),
+            plain or gzipped
+        table_name: Destination table name within the dataset
+        clustering_fields: Optional columns to cluster the table by
+        credentials_file: Path to service account JSON file
+
+    Returns:
+        Number of rows loaded (0 on error)
+    """
+    try:
+        from google.cloud import bigquery
+
+        client = _get_bigquery_client(
+            credentials_file or GOOGLE_CREDENTIALS_FILE,
+            BIGQUERY_REPORTS_PROJECT
+        )
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.CSV,
+            field_delimiter="\t",
+            skip_leading_rows=1,
+            allow_quoted_newlines=True,
+            autodetect=True,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+            clustering_fields=clustering_fields or None,
+        )
+        table_ref = f"{BIGQUERY_REPORTS_PROJECT}.{BIGQUERY_REPORTS_DATASET}.{table_name}"
+        with file_path.open("rb") as f:
+            job = client.load_table_from_file(f, table_ref, job_config=job_config)
+        job.result()
+        return job.output_rows or 0
+    except Exception as e:
+        print(f"Load error: {e}")
+        return 0
+
 
 class SheetsClient:
     """Client for Google Sheets operations."""
@@ -68,7 +199,7 @@ class SheetsClient:
     def _connect(self) -> None:
         """Establish connection to Google Sheets."""
         if self._client is None:
-            self._client = gspread.service_account(filename=self.credentials_file)
+            self._client = _get_gspread_client(self.credentials_file)
             self._spreadsheet = self._client.open_by_key(self.spreadsheet_id)
 
     @property
@@ -118,12 +249,112 @@ class SheetsClient:
             List of rows, where each row is a list of cell values
         """
         rows = []
-        with file_path.open(encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
-            for row in reader:
-                rows.append(row)
+        for chunk in self.iter_csv(file_path):
+            rows.extend(chunk)
         return rows
 
+    def iter_csv(
+        self,
+        file_path: Path,
+        chunk_size: int = UPLOAD_CHUNK_ROWS
+    ) -> Iterator[List[List[str]]]:
+        """
+        Read a tab-delimited CSV file in chunks of rows.
+
+        Parsing is done by Arrow's multi-threaded CSV reader. Every column
+        is read as a string, so cell text reaches Sheets unchanged; the
+        header line is returned as the first row. Arrow rejects rows whose
+        column count differs from the header, so from the first such row
+        on the rest of the file is read with csv.reader, which keeps them.
+        Gzipped *.csv.gz files are decompressed on the fly.
+
+        Args:
+            file_path: Path to CSV file
+            chunk_size: Maximum number of rows per chunk
+
+        Yields:
+            Lists of rows, where each row is a list of cell values
+        """
+        header = _read_header(file_path)
+        if not header:
+            return
+
+        names = [f"f{i}" for i in range(len(header))]
+        pending: List[List[str]] = []
+        rows_read = 0
+        try:
+            # Opening already parses the first block, so it can fail too
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(column_names=names, block_size=CSV_BLOCK_SIZE),
+                # Keep blank lines so Arrow counts rows the way csv.reader does
+                parse_options=pa_csv.ParseOptions(
+                    delimiter="\t", newlines_in_values=True, ignore_empty_lines=False
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in names}
+                ),
+            )
+            for batch in reader:
+                columns = [column.to_pylist() for column in batch.columns]
+                pending.extend(map(list, zip(*columns)))
+                rows_read += batch.num_rows
+                while len(pending) >= chunk_size:
+                    yield pending[:chunk_size]
+                    del pending[:chunk_size]
+        except pa.ArrowInvalid:
+            # Resume after the rows Arrow returned (the header is one of them)
+            with _open_report(file_path) as f:
+                rows = csv.reader(f, delimiter="\t")
+                for row in itertools.islice(rows, rows_read, None):
+                    pending.append(row)
+                    if len(pending) >= chunk_size:
+                        yield pending
+                        pending = []
+        if pending:
+            yield pending
+
+    def _write_chunks(
+        self,
+        worksheet: Worksheet,
+        chunks: Iterable[List[List[str]]]
+    ) -> int:
+        """Write consecutive row chunks starting at A1; returns rows written."""
+        offset = 1
+        for chunk in chunks:
+            # RAW: cells are stored as text, without formula/date parsing
+            worksheet.update(
+                range_name=f"A{offset}",
+                values=chunk,
+                value_input_option=ValueInputOption.raw
+            )
+            offset += len(chunk)
+        return offset - 1
+
+    def _prepare_worksheet(
+        self,
+        sheet_name: str,
+        rows: int,
+        cols: int,
+        clear_first: bool
+    ) -> Worksheet:
+        """
+        Get a worksheet sized exactly for the data about to be written.
+
+        New worksheets are created at the final size. Existing ones are
+        cleared and resized in place when their contents are replaced,
+        so the write never has to grow the grid.
+        """
+        try:
+            worksheet = self.spreadsheet.worksheet(sheet_name)
+        except gspread.WorksheetNotFound:
+            return self.spreadsheet.add_worksheet(title=sheet_name, rows=rows, cols=cols)
+
+        if clear_first:
+            worksheet.clear()
+            worksheet.resize(rows=rows, cols=cols)
+        return worksheet
+
     def upload_data(
         self,
         sheet_name: str,
@@ -144,17 +375,18 @@ class SheetsClient:
         if not data:
             return 0
 
-        worksheet = self.get_or_create_worksheet(
+        worksheet = self._prepare_worksheet(
             sheet_name,
-            rows=len(data) + 1000,
-            cols=len(data[0]) + 5
+            rows=len(data),
+            cols=len(data[0]),
+            clear_first=clear_first
         )
 
-        if clear_first:
-            worksheet.clear()
-
-        worksheet.update(range_name="A1", values=data)
-        return len(data)
+        chunks = (
+            data[i:i + UPLOAD_CHUNK_ROWS]
+            for i in range(0, len(data), UPLOAD_CHUNK_ROWS)
+        )
+        return self._write_chunks(worksheet, chunks)
 
     def upload_csv(
         self,
@@ -165,6 +397,9 @@ class SheetsClient:
         """
         Upload a CSV file to a worksheet.
 
+        The file is streamed in chunks of UPLOAD_CHUNK_ROWS rows, so
+        memory use does not grow with the report size.
+
         Args:
             file_path: Path to the CSV file
             sheet_name: Name of the worksheet/tab
@@ -173,8 +408,137 @@ class SheetsClient:
         Returns:
             Number of rows uploaded
         """
-        data = self.read_csv(file_path)
-        return self.upload_data(sheet_name, data, clear_first)
+        chunks = self.iter_csv(file_path)
+        first_chunk = next(chunks, None)
+        if not first_chunk:
+            return 0
+
+        worksheet = self._prepare_worksheet(
+            sheet_name,
+            rows=_count_lines(file_path),
+            cols=len(first_chunk[0]),
+            clear_first=clear_first
+        )
+
+        return self._write_chunks(worksheet, itertools.chain([first_chunk], chunks))
+
+    def upload_csv_files(
+        self,
+        files: List[Tuple[Path, str]],
+        max_rows: Optional[int] = None,
+        line_counts: Optional[Dict[Path, int]] = None
+    ) -> Dict[str, int]:
+        """
+        Upload several CSV files, replacing each worksheet's contents.
+
+        Worksheet metadata is fetched once and missing sheets are added,
+        at their exact final size, in one spreadsheets.batchUpdate. Rows
+        from every file are written with values.batchUpdate (RAW input)
+        in requests of about UPLOAD_CHUNK_ROWS rows, instead of one round
+        trip per sheet. An existing sheet is cleared and resized in the
+        same flush that writes its first rows, so a failure partway
+        through leaves the sheets not yet reached untouched.
+
+        Args:
+            files: List of (file_path, sheet_name) pairs
+            max_rows: Optional limit on data rows per sheet (header excluded)
+            line_counts: Known line counts per file, to skip counting them
+
+        Returns:
+            Mapping of sheet name to number of rows uploaded
+        """
+        sheet_ids = {ws.title: ws.id for ws in self.spreadsheet.worksheets()}
+
+        targets: List[Tuple[Path, str, Dict[str, int]]] = []
+        add_requests: List[Dict] = []
+        for file_path, sheet_name in files:
+            header = _read_header(file_path)
+            if not header:
+                continue
+
+            row_count = (line_counts or {}).get(file_path) or _count_lines(file_path)
+            if max_rows is not None:
+                row_count = min(row_count, max_rows + 1)
+
+            grid = {
+                "rowCount": row_count,
+                "columnCount": len(header),
+            }
+            if sheet_name not in sheet_ids:
+                add_requests.append({"addSheet": {
+                    "properties": {"title": sheet_name, "gridProperties": grid},
+                }})
+            targets.append((file_path, sheet_name, grid))
+
+        if not targets:
+            return {}
+
+        if add_requests:
+            self.spreadsheet.batch_update({"requests": add_requests})
+
+        uploaded: Dict[str, int] = {}
+        pending: List[Dict] = []
+        pending_rows = 0
+        sheet_requests: List[Dict] = []
+
+        def flush() -> None:
+            nonlocal pending, pending_rows, sheet_requests
+            if sheet_requests:
+                self.spreadsheet.batch_update({"requests": sheet_requests})
+            if pending:
+                self._values_batch_update({
+                    "valueInputOption": ValueInputOption.raw,
+                    "data": pending,
+                })
+            pending = []
+            pending_rows = 0
+            sheet_requests = []
+
+        row_limit = None if max_rows is None else max_rows + 1
+        for file_path, sheet_name, grid in targets:
+            if sheet_name in sheet_ids:
+                # Clear and resize right before this sheet's rows are sent
+                sheet_id = sheet_ids[sheet_name]
+                sheet_requests.append({"updateCells": {
+                    "range": {"sheetId": sheet_id},
+                    "fields": "userEnteredValue",
+                }})
+                sheet_requests.append({"updateSheetProperties": {
+                    "properties": {"sheetId": sheet_id, "gridProperties": grid},
+                    "fields": "gridProperties(rowCount,columnCount)",
+                }})
+
+            offset = 1
+            for chunk in self.iter_csv(file_path):
+                if row_limit is not None:
+                    chunk = chunk[:row_limit - offset + 1]
+                    if not chunk:
+                        break
+                pending.append({
+                    "range": absolute_range_name(sheet_name, f"A{offset}"),
+                    "values": chunk,
+                })
+                offset += len(chunk)
+                pending_rows += len(chunk)
+                if pending_rows >= UPLOAD_CHUNK_ROWS:
+                    flush()
+            uploaded[sheet_name] = offset - 1
+
+        flush()
+        return uploaded
+
+    def _values_batch_update(self, body: Dict[str, Any]) -> None:
+        """Send a values.batchUpdate, encoding the body with orjson if available."""
+        if orjson is None:
+            self.spreadsheet.values_batch_update(body=body)
+            return
+
+        self.spreadsheet.client.request(
+            "post",
+            SPREADSHEET_VALUES_BATCH_UPDATE_URL % self.spreadsheet.id,
+            data=orjson.dumps(body),
+            headers={"Content-Type": "application/json"},
+        )
 
     def upsert_csv(
         self,
@@ -196,12 +560,10 @@ class SheetsClient:
         Returns:
             Number of rows in final dataset
         """
-        new_data = self.read_csv(file_path)
-        if not new_data:
+        header = _read_header(file_path)
+        if not header:
             return 0
 
-        header = new_data[0]
-
         # Get key column indices
         key_indices = []
         for col_name in key_columns:
@@ -212,22 +574,22 @@ class SheetsClient:
 
         if not key_indices:
             # No key columns found, do full replace
-            return self.upload_data(sheet_name, new_data)
+            return self.upload_csv(file_path, sheet_name)
 
-        # Get existing data
+        # Only the header row is needed to detect schema changes
         worksheet = self.get_or_create_worksheet(sheet_name)
         try:
-            existing_data = worksheet.get_all_values()
+            existing_header = worksheet.row_values(1)
         except Exception:
-            existing_data = []
+            existing_header = []
 
-        if not existing_data or existing_data[0] != header:
+        if existing_header != header:
             # Different schema or empty, use new data
-            return self.upload_data(sheet_name, new_data)
+            return self.upload_csv(file_path, sheet_name)
 
         # Build merged dataset (new data takes precedence)
         # For App Store data, new export is authoritative
-        return self.upload_data(sheet_name, new_data)
+        return self.upload_csv(file_path, sheet_name)
 
 
 # -----------------------------------------------------------------------------
@@ -260,24 +622,102 @@ REPORT_SHEET_NAMES: Dict[str, str] = {
 }
 
 
+# Per-directory record of what upload_all_reports last uploaded
+UPLOAD_MANIFEST = ".uploaded_manifest.json"
+
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the upload manifest, or an empty one if missing or invalid."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
 def upload_all_reports(reports_dir: Path) -> None:
     """
     Upload all CSV reports from a directory to Google Sheets.
 
+    Reports archived by COMPRESS_REPORTS (*.csv.gz) are read in place
+    when the plain file is missing. Empty files are skipped, as are
+    files whose size and modification time match the last successful
+    upload recorded in UPLOAD_MANIFEST. If BIGQUERY_REPORTS_DATASET is
+    set, files over BIGQUERY_LOAD_MIN_SIZE are loaded in full into a
+    BigQuery table named after the file, and only their first
+    SHEETS_PREVIEW_ROWS rows are written to Sheets. Files that fail to
+    load are uploaded to Sheets in full instead.
+
     Args:
         reports_dir: Directory containing CSV report files
     """
     client = SheetsClient()
     print(f"Connected to: {client.spreadsheet_title}")
 
+    manifest_path = reports_dir / UPLOAD_MANIFEST
+    manifest = _load_manifest(manifest_path)
+
+    files: List[Tuple[Path, str]] = []
+    large_files: List[Tuple[Path, str]] = []
     for filename, sheet_name in REPORT_SHEET_NAMES.items():
         file_path = reports_dir / filename
+        if not file_path.exists():
+            file_path = reports_dir / f"{filename}.gz"
         if not file_path.exists():
             print(f"  Skipping {filename}: file not found")
             continue
 
-        print(f"  Uploading {filename} -> '{sheet_name}'...")
-        rows = client.upload_csv(file_path, sheet_name)
-        print(f"    Uploaded {rows} rows")
+        stat = file_path.stat()
+        if stat.st_size == 0:
+            print(f"  Skipping {filename}: empty file")
+            continue
+
+        previous = manifest.get(file_path.name, {})
+        if (previous.get("mtime"), previous.get("size")) == (stat.st_mtime, stat.st_size):
+            print(f"  Skipping {filename}: unchanged since last upload")
+            continue
 
+        if BIGQUERY_REPORTS_DATASET and stat.st_size > BIGQUERY_LOAD_MIN_SIZE:
+            large_files.append((file_path, sheet_name))
+        else:
+            files.append((file_path, sheet_name))
+
+    if not files and not large_files:
+        print("Nothing to upload.")
+        return
+
+    uploaded: Dict[str, int] = {}
+    if large_files:
+        loaded = []
+        for file_path, sheet_name in large_files:
+            header = _read_header(file_path)
+            clustering = ["Date"] if "Date" in header else None
+            table_name = _report_name(file_path)
+            rows = load_csv_to_bigquery(file_path, table_name, clustering, client.credentials_file)
+            if not rows:
+                print(f"  {file_path.name}: BigQuery load failed, uploading in full")
+                files.append((file_path, sheet_name))
+                continue
+            print(f"    {file_path.name}: loaded {rows} rows into BigQuery table {table_name}")
+            loaded.append((file_path, sheet_name))
+
+        large_files = loaded
+        if large_files:
+            uploaded.update(client.upload_csv_files(large_files, max_rows=SHEETS_PREVIEW_ROWS))
+
+    if files:
+        print(f"  Uploading {len(files)} files...")
+        uploaded.update(client.upload_csv_files(files))
+    for file_path, sheet_name in files + large_files:
+        rows = uploaded.get(sheet_name, 0)
+        print(f"    '{sheet_name}': uploaded {rows} rows")
+
+        stat = file_path.stat()
+        manifest[file_path.name] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "rows": rows,
+        }
+
+    manifest_path.write_text(json.dumps(manifest, indent=2))
     print("Upload complete!")
@@ -19,20 +19,27 @@ Environment variables:
     GOOGLE_SPREADSHEET_ID: Google Sheets spreadsheet ID
     GOOGLE_CREDENTIALS_FILE: Path to service account JSON
     APP_NAME: App name for reports (optional)
+    COMPRESS_REPORTS: Set to 1 to gzip the CSVs once uploaded (optional)
 """
 
 from __future__ import annotations
 
+import argparse
+import gzip
+import hashlib
+import json
 import os
-from datetime import datetime
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
-from appstore_api import AppStoreClient, get_date_range, format_file_size
+from appstore_api import COPY_CHUNK_SIZE, DOWNLOAD_WORKERS, get_client, get_report_stats, format_file_size
 from google_sheets import SheetsClient, REPORT_SHEET_NAMES
-from firebase_analytics import FirebaseAnalytics, FIREBASE_SHEET_NAMES
+from firebase_analytics import FirebaseAnalytics, FIREBASE_REPORTS, FIREBASE_SHEET_NAMES
 
 load_dotenv()
 
@@ -41,6 +48,13 @@ REQUEST_ID = os.getenv("ANALYTICS_REQUEST_ID", "")
 APP_NAME = os.getenv("APP_NAME", "App")
 REPORTS_DIR = Path("reports")
 LOGS_DIR = Path("logs")
+COMPRESS_REPORTS = os.getenv("COMPRESS_REPORTS", "0") == "1"
+
+# Per-run file hashes, compared with the previous run's folder
+RUN_MANIFEST = "manifest.json"
+
+# Time of the last Firebase export, compared against partition metadata
+FIREBASE_STATE_FILE = REPORTS_DIR / ".firebase_state.json"
 
 # Reports to download
 # (report_id_prefix, granularities, filename_template)
@@ -55,6 +69,23 @@ REPORTS = [
     ("r15", ["DAILY", "WEEKLY", "MONTHLY"], "discovery_detailed_{g}.csv"),
 ]
 
+# Flattened download tasks: (report_id_prefix, granularity, filename)
+REPORT_TASKS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (prefix, granularity, filename_tpl.format(g=granularity.lower()))
+    for prefix, granularities, filename_tpl in REPORTS
+    for granularity in granularities
+)
+
+# Summary categories by filename prefix, in the order they are listed
+CATEGORY_PREFIXES = {
+    "downloads_": "Downloads",
+    "purchases_": "Purchases",
+    "install_delete_": "Install-Delete",
+    "sessions_": "Sessions",
+    "discovery_": "Discovery",
+    "firebase_": "Firebase",
+}
+
 
 class WeeklySyncJob:
     """
@@ -64,20 +95,29 @@ class WeeklySyncJob:
     and uploads to Google Sheets.
     """
 
-    def __init__(self):
-        """Initialize the sync job."""
+    def __init__(self, force: bool = False):
+        """
+        Initialize the sync job.
+
+        Args:
+            force: Download reports again even if today's files exist
+        """
         if not REQUEST_ID:
             raise SystemExit(
                 "ANALYTICS_REQUEST_ID is not set.\n"
                 "Add it to your .env file."
             )
 
-        self.client = AppStoreClient()
-        self.date_str = datetime.now().strftime("%Y-%m-%d")
-        self.output_dir = REPORTS_DIR / self.date_str
+        self.client = get_client()
         self.start_time = datetime.now()
+        self.date_str = self.start_time.strftime("%Y-%m-%d")
+        self.output_dir = REPORTS_DIR / self.date_str
+        self.download_end_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.downloaded: List[Dict[str, Any]] = []
+        self.force = force
+        self.sheets: Optional[SheetsClient] = None
+        self._previous_manifest: Optional[Dict[str, Dict[str, Any]]] = None
 
     def run(self) -> None:
         """Execute the full sync job."""
@@ -85,17 +125,35 @@ class WeeklySyncJob:
         print(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Output: {self.output_dir}\n")
 
-        # Step 1: Download App Store reports
+        # Step 1: Download App Store reports and compare with the previous run
         self._download_reports()
-
-        # Step 2: Download Firebase Analytics
-        self._download_firebase()
+        appstore_files = list(self.downloaded)
+        self._hash_files(appstore_files)
+        self.sheets = self._connect_sheets()
+
+        # Step 2: Download Firebase Analytics while App Store reports upload
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload = executor.submit(self._upload_to_sheets, appstore_files)
+            self._download_firebase()
+            self.download_end_time = datetime.now()
+            # Printed only now so it doesn't interleave with the Firebase output
+            self._print_upload(upload.result())
+
+        firebase_files = self.downloaded[len(appstore_files):]
+        self._hash_files(firebase_files)
+        self._write_manifest()
 
         # Step 3: Create markdown summary
         self._create_summary()
 
-        # Step 4: Upload to Google Sheets
-        self._upload_to_sheets()
+        # Step 4: Upload Firebase reports to Google Sheets
+        if firebase_files:
+            self._print_upload(self._upload_to_sheets(firebase_files))
+            self._write_manifest()
+
+        # Step 5: Compress the archived CSVs
+        if COMPRESS_REPORTS:
+            self._compress_reports()
 
         # Done
         self.end_time = datetime.now()
@@ -115,55 +173,116 @@ class WeeklySyncJob:
         print()
 
     def _download_reports(self) -> None:
-        """Download all configured reports."""
+        """Download all configured reports, several at a time."""
         self._print_header("Downloading Reports")
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        for prefix, granularities, filename_tpl in REPORTS:
-            report_id = f"{prefix}-{REQUEST_ID}"
-
-            for granularity in granularities:
-                filename = filename_tpl.format(g=granularity.lower())
-                print(f"Downloading: {filename}...")
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._download_one, f"{prefix}-{REQUEST_ID}", granularity, filename
+                ): filename
+                for prefix, granularity, filename in REPORT_TASKS
+            }
 
+            for future in as_completed(futures):
+                print(f"Downloading: {futures[future]}...")
                 try:
-                    instances = self.client.get_instances(report_id, granularity)
-                    if not instances:
-                        print("  No instances available")
-                        continue
-
-                    instance = instances[0]
-                    result = self.client.download_instance(
-                        instance["id"],
-                        self.output_dir,
-                        filename
-                    )
-
-                    if result:
-                        size = result.stat().st_size
-                        oldest, newest = get_date_range(result)
-                        download_time = datetime.now().strftime("%H:%M")
-
-                        self.downloaded.append({
-                            "filename": filename,
-                            "path": result,
-                            "size": size,
-                            "size_fmt": format_file_size(size),
-                            "time": download_time,
-                            "oldest": oldest,
-                            "newest": newest,
-                        })
-
-                        print(f"  Saved: {filename} ({format_file_size(size)})")
-                    else:
-                        print("  No segments available")
-
+                    info, message = future.result()
+                    print(f"  {message}")
+                    if info:
+                        self.downloaded.append(info)
                 except Exception as e:
                     print(f"  Error: {e}")
 
         print(f"\nDownloaded {len(self.downloaded)} files")
 
+    def _download_one(
+        self,
+        report_id: str,
+        granularity: str,
+        filename: str
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Download the latest instance of one report.
+
+        Returns:
+            Tuple of (file info or None, status message)
+        """
+        existing = self._existing_file(filename)
+        if existing:
+            oldest, newest, lines = get_report_stats(existing["path"])
+            existing.update(oldest=oldest, newest=newest, lines=lines)
+            return existing, f"Already downloaded: {filename} ({existing['size_fmt']})"
+
+        instances = self.client.get_instances(report_id, granularity)
+        if not instances:
+            return None, "No instances available"
+
+        result = self.client.download_instance(instances[0]["id"], self.output_dir, filename)
+        if not result:
+            return None, "No segments available"
+
+        size = result.stat().st_size
+        # One scan gives the summary's date range and the sheet's size
+        oldest, newest, lines = get_report_stats(result)
+        info = {
+            "filename": filename,
+            "path": result,
+            "size": size,
+            "size_fmt": format_file_size(size),
+            "time": datetime.now().strftime("%H:%M"),
+            "oldest": oldest,
+            "newest": newest,
+            "lines": lines,
+        }
+        return info, f"Saved: {filename} ({info['size_fmt']})"
+
+    def _existing_file(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Get file info for a report already saved in today's folder.
+
+        Downloads are renamed into place only when complete, so any
+        non-empty file is a finished one from an earlier run today.
+        Reports already gzipped by COMPRESS_REPORTS are decompressed
+        back to the plain file, which the summary and upload read.
+
+        Returns:
+            File info without date range, or None if it must be fetched
+        """
+        if self.force:
+            return None
+
+        path = self.output_dir / filename
+        gz_path = path.with_name(f"{filename}.gz")
+        if not path.exists() and gz_path.exists():
+            tmp_path = path.with_name(f"{filename}.tmp")
+            try:
+                with gzip.open(gz_path, "rb") as f_in, tmp_path.open("wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
+                os.replace(tmp_path, path)
+                gz_path.unlink()
+            except (OSError, EOFError) as e:
+                print(f"  Error decompressing {gz_path.name}: {e}")
+                tmp_path.unlink(missing_ok=True)
+                return None
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not stat.st_size:
+            return None
+
+        return {
+            "filename": filename,
+            "path": path,
+            "size": stat.st_size,
+            "size_fmt": format_file_size(stat.st_size),
+            "time": datetime.fromtimestamp(stat.st_mtime).strftime("%H:%M"),
+        }
+
     def _download_firebase(self) -> None:
         """Download Firebase Analytics data from BigQuery."""
         self._print_header("Downloading Firebase Analytics")
@@ -174,50 +293,129 @@ class WeeklySyncJob:
             print(f"Skipping Firebase: {e}")
             return
 
-        # Reports to download: (method_name, filename, description, days)
-        firebase_reports = [
-            ("get_events_summary", "firebase_events_summary.csv", "Events Summary", 30),
-            ("get_daily_active_users", "firebase_daily_users.csv", "Daily Active Users", 30),
-            ("get_retention", "firebase_retention.csv", "User Retention", 30),
-            ("get_screen_views", "firebase_screens.csv", "Screen Views", 30),
-            ("get_user_properties", "firebase_user_properties.csv", "User Properties", 30),
-        ]
+        # Reuse today's exports from an earlier run
+        existing = [self._existing_file(filename) for _, filename, _, _ in FIREBASE_REPORTS]
+        if all(existing):
+            for info in existing:
+                info.update(oldest="-", newest="-", source="firebase")
+                self.downloaded.append(info)
+                print(f"Already downloaded: {info['filename']} ({info['size_fmt']})")
+            return
+
+        # Skip queries, exports and uploads if no event partition changed
+        run_started = datetime.now(timezone.utc)
+        last_run = self._read_firebase_last_run()
+        last_modified = firebase.events_last_modified()
+        if not self.force and last_run and last_modified and last_modified <= last_run:
+            print(f"Skipping Firebase: no new events since {last_run:%Y-%m-%d %H:%M} UTC")
+            return
+
+        # Retention is read from a rollup table rebuilt once per run
+        print("Refreshing retention rollup...")
+        if not firebase.refresh_retention():
+            print("  Retention report may be stale")
+
+        # All report queries run concurrently on the shared BigQuery client
+        print("Running report queries...")
+        try:
+            results = firebase.run_all()
+        except Exception as e:
+            print(f"  Error: {e}")
+            return
 
-        for method_name, filename, description, days in firebase_reports:
+        for method_name, filename, description, _ in FIREBASE_REPORTS:
             print(f"Downloading: {description}...")
 
             try:
-                method = getattr(firebase, method_name, None)
-                if method is None:
-                    # Try alternate method name
-                    method = getattr(firebase, f"get_user_retention" if "retention" in method_name else method_name, None)
-
-                if method:
-                    data = method(days=days) if "days" in method.__code__.co_varnames else method()
-
-                    if data:
-                        result = firebase.export_to_csv(data, self.output_dir, filename)
-                        if result:
-                            size = result.stat().st_size
-                            self.downloaded.append({
-                                "filename": filename,
-                                "path": result,
-                                "size": size,
-                                "size_fmt": format_file_size(size),
-                                "time": datetime.now().strftime("%H:%M"),
-                                "oldest": "-",
-                                "newest": "-",
-                                "source": "firebase"
-                            })
-                            print(f"  Saved: {filename} ({format_file_size(size)})")
-                    else:
-                        print(f"  No data available")
+                data = results.get(method_name)
+                if data:
+                    result = firebase.export_to_csv(data, self.output_dir, filename)
+                    if result:
+                        size = result.stat().st_size
+                        size_fmt = format_file_size(size)
+                        self.downloaded.append({
+                            "filename": filename,
+                            "path": result,
+                            "size": size,
+                            "size_fmt": size_fmt,
+                            "time": datetime.now().strftime("%H:%M"),
+                            "oldest": "-",
+                            "newest": "-",
+                            "source": "firebase"
+                        })
+                        print(f"  Saved: {filename} ({size_fmt})")
+                else:
+                    print(f"  No data available")
             except Exception as e:
                 print(f"  Error: {e}")
 
         firebase_count = sum(1 for f in self.downloaded if f.get("source") == "firebase")
         print(f"\nDownloaded {firebase_count} Firebase reports")
 
+        if firebase_count:
+            FIREBASE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            FIREBASE_STATE_FILE.write_text(json.dumps({"last_run": run_started.isoformat()}))
+
+    def _read_firebase_last_run(self) -> Optional[datetime]:
+        """Get the start time of the last successful Firebase export."""
+        try:
+            state = json.loads(FIREBASE_STATE_FILE.read_text())
+            return datetime.fromisoformat(state["last_run"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _hash_files(self, files: List[Dict[str, Any]]) -> None:
+        """
+        Hash downloaded files and compare them with the previous run.
+
+        Files whose hash matches a previous upload are marked unchanged,
+        so their Sheets upload is skipped, and the change in line count
+        is recorded for the summary.
+
+        Args:
+            files: File info entries from self.downloaded to hash
+        """
+        if self._previous_manifest is None:
+            self._previous_manifest = self._read_previous_manifest()
+
+        for f in files:
+            f["sha"] = _file_digest(f["path"])
+            prev = self._previous_manifest.get(f["filename"], {})
+            f["unchanged"] = bool(prev.get("uploaded")) and prev.get("sha") == f["sha"]
+            if "lines" in f and "lines" in prev:
+                f["delta_rows"] = f["lines"] - prev["lines"]
+
+    def _write_manifest(self) -> None:
+        """
+        Save this run's manifest of every file hashed so far.
+
+        Each entry records whether the file's contents are in Sheets, so
+        a file is only skipped next run once its upload has succeeded.
+        """
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for f in self.downloaded:
+            if "sha" in f:
+                entry = {"sha": f["sha"], "size": f["size"], "uploaded": f.get("uploaded", False)}
+                if "lines" in f:
+                    entry["lines"] = f["lines"]
+                manifest[f["filename"]] = entry
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / RUN_MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    def _read_previous_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest of the most recent earlier run, if any."""
+        folders = sorted(
+            (p for p in REPORTS_DIR.iterdir() if p.is_dir() and p.name < self.date_str),
+            reverse=True
+        )
+        for folder in folders:
+            try:
+                return json.loads((folder / RUN_MANIFEST).read_text())
+            except (OSError, ValueError):
+                continue
+        return {}
+
     def _create_summary(self) -> None:
         """Create markdown summary file."""
         self._print_header("Creating Summary")
@@ -225,97 +423,181 @@ class WeeklySyncJob:
         md_path = self.output_dir / f"{self.date_str}-reports.md"
 
         # Group by category
-        categories = {
-            "Downloads": [],
-            "Purchases": [],
-            "Install-Delete": [],
-            "Sessions": [],
-            "Discovery": [],
-            "Firebase": [],
+        categories: Dict[str, List[Dict[str, Any]]] = {
+            category: [] for category in CATEGORY_PREFIXES.values()
         }
 
         for f in self.downloaded:
             name = f["filename"]
-            if "firebase" in name:
-                categories["Firebase"].append(f)
-            elif "downloads" in name:
-                categories["Downloads"].append(f)
-            elif "purchases" in name:
-                categories["Purchases"].append(f)
-            elif "install_delete" in name:
-                categories["Install-Delete"].append(f)
-            elif "sessions" in name:
-                categories["Sessions"].append(f)
-            elif "discovery" in name:
-                categories["Discovery"].append(f)
-
-        # Write markdown
-        with md_path.open("w", encoding="utf-8") as md:
-            md.write("# App Store Analytics Reports\n\n")
-            md.write(f"**App:** {APP_NAME}\n\n")
-
-            md.write("## Download Info\n\n")
-            md.write("| Parameter | Value |\n")
-            md.write("|-----------|-------|\n")
-            md.write(f"| Download started | {self.start_time.strftime('%Y-%m-%d %H:%M')} |\n")
-            end_str = datetime.now().strftime('%Y-%m-%d %H:%M')
-            md.write(f"| Download finished | {end_str} |\n\n")
-
-            md.write("## Downloaded Reports\n\n")
-            md.write("| File | Size | Time | Oldest | Newest |\n")
-            md.write("|------|------|------|--------|--------|\n")
-
-            for cat_name, files in categories.items():
-                if files:
-                    md.write(f"| **{cat_name}** | | | | |\n")
-                    for f in sorted(files, key=lambda x: x["filename"]):
-                        md.write(
-                            f"| {f['filename']} | {f['size_fmt']} | "
-                            f"{f['time']} | {f['oldest']} | {f['newest']} |\n"
-                        )
-
-            md.write(f"\n**Total:** {len(self.downloaded)} files\n")
+            category = next(
+                (cat for prefix, cat in CATEGORY_PREFIXES.items() if name.startswith(prefix)),
+                None
+            )
+            if category:
+                categories[category].append(f)
+
+        # Build markdown, then write it in one call
+        end_str = (self.download_end_time or datetime.now()).strftime('%Y-%m-%d %H:%M')
+        lines = [
+            "# App Store Analytics Reports\n",
+            f"**App:** {APP_NAME}\n",
+            "## Download Info\n",
+            "| Parameter | Value |",
+            "|-----------|-------|",
+            f"| Download started | {self.start_time.strftime('%Y-%m-%d %H:%M')} |",
+            f"| Download finished | {end_str} |\n",
+            "## Downloaded Reports\n",
+            "| File | Size | Time | Oldest | Newest | Rows +/- |",
+            "|------|------|------|--------|--------|----------|",
+        ]
 
-        print(f"Created: {md_path}")
+        for cat_name, files in categories.items():
+            if files:
+                lines.append(f"| **{cat_name}** | | | | | |")
+                lines.extend(
+                    f"| {f['filename']} | {f['size_fmt']} | "
+                    f"{f['time']} | {f['oldest']} | {f['newest']} | "
+                    f"{_format_delta(f.get('delta_rows'))} |"
+                    for f in sorted(files, key=lambda x: x["filename"])
+                )
 
-    def _upload_to_sheets(self) -> None:
-        """Upload reports to Google Sheets."""
-        self._print_header("Uploading to Google Sheets")
+        lines.append(f"\n**Total:** {len(self.downloaded)} files\n")
+        md_path.write_text("\n".join(lines), encoding="utf-8")
+
+        print(f"Created: {md_path}")
 
+    def _connect_sheets(self) -> Optional[SheetsClient]:
+        """Connect to Google Sheets once per run (None if not configured)."""
         try:
             sheets = SheetsClient()
-            print(f"Connected to: {sheets.spreadsheet_title}\n")
+            print(f"Connected to Google Sheets: {sheets.spreadsheet_title}")
+            return sheets
         except SystemExit as e:
             print(f"Skipping Google Sheets upload: {e}")
-            return
+            return None
 
-        for f in self.downloaded:
+    def _upload_to_sheets(self, downloaded: List[Dict[str, Any]]) -> List[str]:
+        """
+        Upload reports to Google Sheets.
+
+        Nothing is printed, since this may run on a worker thread while
+        Firebase downloads; the caller prints the returned messages.
+
+        Args:
+            downloaded: File info entries from self.downloaded to upload
+
+        Returns:
+            Status messages, in order (empty if Sheets is not connected)
+        """
+        if self.sheets is None:
+            return []
+
+        messages: List[str] = []
+        files = []
+        by_sheet: Dict[str, Dict[str, Any]] = {}
+        line_counts: Dict[Path, int] = {}
+        for f in downloaded:
             filename = f["filename"]
             # Check both App Store and Firebase sheet mappings
             sheet_name = REPORT_SHEET_NAMES.get(filename) or FIREBASE_SHEET_NAMES.get(filename)
 
             if not sheet_name:
-                print(f"  Skipping {filename}: no sheet mapping")
+                messages.append(f"  Skipping {filename}: no sheet mapping")
                 continue
 
-            print(f"Uploading: {filename} -> '{sheet_name}'...")
+            if f.get("unchanged") and not self.force:
+                # The sheet still holds the previous run's identical upload
+                f["uploaded"] = True
+                messages.append(f"  Skipping {filename}: unchanged since last run")
+                continue
+
+            messages.append(f"Uploading: {filename} -> '{sheet_name}'...")
+            files.append((f["path"], sheet_name))
+            by_sheet[sheet_name] = f
+            if "lines" in f:
+                line_counts[f["path"]] = f["lines"]
+
+        if not files:
+            messages.append("Nothing to upload.")
+            return messages
+
+        # All sheets are cleared and written in batched requests
+        try:
+            for sheet_name, rows in self.sheets.upload_csv_files(files, line_counts=line_counts).items():
+                by_sheet[sheet_name]["uploaded"] = True
+                messages.append(f"  '{sheet_name}': uploaded {rows} rows")
+        except Exception as e:
+            messages.append(f"  Error: {e}")
+
+        messages.append("\nUpload complete!")
+        return messages
+
+    def _print_upload(self, messages: List[str]) -> None:
+        """Print the messages of an upload pass under their header."""
+        if not messages:
+            return
+
+        self._print_header("Uploading to Google Sheets")
+        for message in messages:
+            print(message)
+
+    def _compress_reports(self) -> None:
+        """
+        Gzip the downloaded CSVs in place (file.csv -> file.csv.gz).
+
+        Runs after the summary and upload, which read the plain files.
+        Level 1 is nearly as fast as copying and still shrinks the
+        text-heavy reports several times over.
+        """
+        self._print_header("Compressing Reports")
 
+        compressed = 0
+        for f in self.downloaded:
+            path: Path = f["path"]
+            gz_path = path.with_name(f"{path.name}.gz")
             try:
-                rows = sheets.upload_csv(f["path"], sheet_name)
-                print(f"  Uploaded {rows} rows")
-            except Exception as e:
-                print(f"  Error: {e}")
+                with path.open("rb") as f_in, \
+                        gzip.open(gz_path, "wb", compresslevel=1) as f_out:
+                    shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
+                path.unlink()
+                f["path"] = gz_path
+                compressed += 1
+            except OSError as e:
+                print(f"  Error compressing {path.name}: {e}")
+                gz_path.unlink(missing_ok=True)
 
-        print("\nUpload complete!")
+        print(f"Compressed {compressed} files")
+
+
+def _format_delta(delta: Optional[int]) -> str:
+    """Format a row-count change for the summary table."""
+    return "-" if delta is None else f"{delta:+d}"
+
+
+def _file_digest(path: Path) -> str:
+    """Hash a file's contents (BLAKE2b, 128-bit) without loading it whole."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(COPY_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 def main() -> None:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Weekly App Store Analytics sync")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download all reports again, even if today's files exist"
+    )
+    args = parser.parse_args()
+
     # Ensure logs directory exists
     LOGS_DIR.mkdir(exist_ok=True)
 
     # Run sync job
-    job = WeeklySyncJob()
+    job = WeeklySyncJob(force=args.force)
     job.run()
 
 